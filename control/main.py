@@ -3,7 +3,7 @@
 import time
 
 from control.user_input import UserInput
-from model.entities import Combatant, RailgunProjectile, PhysicalEntity
+from model.entities import RailgunProjectile
 from model.worlds import World
 from settings import GameSettings
 
@@ -23,6 +23,7 @@ class GameControl:
         """
         self.world = world
         self.simulation_speed = GameSettings.simulation_speed
+        self.tick_interval = 1 / self.simulation_speed
 
         self.user_input = UserInput()
         self.gui_info = GUIInfo()
@@ -31,34 +32,48 @@ class GameControl:
 
     def run(self):
         """Start running the simulation."""
+        # schedule against an absolute deadline instead of the time of the last tick, otherwise the time spent
+        # simulating accumulates as drift and the tick spacing becomes uneven.
+        next_deadline = time.perf_counter()
         while self.is_running:
-            seconds_since_last_tick = time.perf_counter() - self.last_update
-            if seconds_since_last_tick < 1 / self.simulation_speed:
-                time.sleep(1 / self.simulation_speed - seconds_since_last_tick)
-
             self.simulation_tick()
             self.last_update = time.perf_counter()
 
+            next_deadline += self.tick_interval
+            remaining = next_deadline - time.perf_counter()
+            if remaining < -self.tick_interval:
+                # more than a full tick behind; rebase instead of free-running to catch up
+                next_deadline = time.perf_counter()
+            elif remaining > 0.002:
+                # time.sleep is too coarse to hit the tick rate exactly, so sleep up to the last millisecond and
+                # spin-wait through the rest.
+                time.sleep(remaining - 0.001)
+            while time.perf_counter() < next_deadline:
+                pass
+
     def simulation_tick(self):
         """Update the world."""
         self._handle_non_game_user_input()
         self.world.world_update()
+        # the world sorts its entities into buckets on add/remove, so no isinstance checks are needed here
         for entity in self.world.entities:
-            if isinstance(entity, PhysicalEntity):
-                if entity.structure.hp == 0:
-                    entity.destroy(self.world.add_entity)
-                    continue
-                entity.structure.activate()
+            if entity.structure.hp == 0:
+                entity.destroy(self.world.add_entity)
+                continue
+            entity.structure.activate()
 
-            if isinstance(entity, Combatant):
-                entity.reactor.activate()
-                if entity is self.world.player:
-                    entity.engine.activate(self.user_input)  # noqa does not recognice the check for Combatant
-                else:
-                    pass  # todo implement logic to move NPCs
-                entity.shields.activate()
-                if shot_params := entity.railgun.activate(user_input=self.user_input):
-                    self.world.add_entity(RailgunProjectile, shot_params)
+        player = self.world.player
+        for entity in self.world.combatants:
+            if entity.structure.hp == 0:
+                continue
+            entity.reactor.activate()
+            if entity is player:
+                entity.engine.activate(self.user_input)
+            else:
+                pass  # todo implement logic to move NPCs
+            entity.shields.activate()
+            if shot_params := entity.railgun.activate(user_input=self.user_input):
+                self.world.add_entity(RailgunProjectile, shot_params)
 
     def _handle_non_game_user_input(self):
         """React to non-game related user input such as opening menus."""
@@ -1,20 +1,42 @@
 import math
+from typing import Final
 
 import numpy as np
 
+_SQRT_PI: Final = math.sqrt(math.pi)
+
+_SINCOS_RESOLUTION: Final = 10  # table entries per degree
+_TABLE_ANGLES = np.deg2rad(np.arange(360 * _SINCOS_RESOLUTION) / _SINCOS_RESOLUTION)
+_SIN_TABLE = np.sin(_TABLE_ANGLES)
+_COS_TABLE = np.cos(_TABLE_ANGLES)
+
+
+def sincos_deg(angle_deg: float) -> tuple[float, float]:
+    """Return (sin, cos) of the angle quantized to 0.1 degrees via a lookup table.
+
+    The table replaces two transcendental calls in the per-tick movement path. A 0.1 degree quantization is far below
+    anything noticeable in the simulation.
+
+    :param angle_deg: angle in degrees, clockwise with 0 is up.
+    """
+    index = int(angle_deg * _SINCOS_RESOLUTION) % (360 * _SINCOS_RESOLUTION)
+    return _SIN_TABLE[index], _COS_TABLE[index]
+
 
 def rotate_vector_2d(vector: np.ndarray, angle_deg: float):
     """Rotate a 2D vector by a given angle.
 
+    This is called for every impulse of every entity each tick, so it uses plain scalar math instead of building a
+    2x2 rotation matrix.
+
     vector: numpy array-like of shape (2,), e.g. width x height
     angle_deg: angle in degrees, clockwise
     """
-    angle_rad = -np.deg2rad(angle_deg)
-    rot = np.array([
-        [np.cos(angle_rad), -np.sin(angle_rad)],
-        [np.sin(angle_rad),  np.cos(angle_rad)]
-    ])
-    return rot @ np.asarray(vector)
+    angle_rad = -math.radians(angle_deg)
+    cos = math.cos(angle_rad)
+    sin = math.sin(angle_rad)
+    x, y = vector
+    return np.array([cos * x - sin * y, sin * x + cos * y])
 
 
 def vector_from_angle_magnitude(angle: float, magnitude: float) -> np.ndarray:
@@ -23,7 +45,8 @@ def vector_from_angle_magnitude(angle: float, magnitude: float) -> np.ndarray:
     :param angle: Angle to move towards in [0, 360) clockwise with 0 is up.
     :param magnitude: The strength of the impulse.
     """
-    return rotate_vector_2d(np.array([0, magnitude]), angle)
+    sin, cos = sincos_deg(angle)
+    return np.array([sin * magnitude, cos * magnitude])
 
 def angle_magnitude_from_vector(vector: np.ndarray) -> tuple[float, float]:
     """Returns the angle and magnitude of a vector.
@@ -40,13 +63,19 @@ def get_point_angle(relative_x: float, relative_y: float) -> float:
 
     :returns: a value in degrees [0, 360) clockwise with 0 is up.
     """
-    return np.rad2deg(np.arctan2(relative_x, relative_y)) % 360
+    return math.degrees(math.atan2(relative_x, relative_y)) % 360
 
-def limit_vector(vector: np.ndarray, max_magnitude: float) -> np.ndarray:
-    """Shortens the magnitude of the vector to the max_magnitude if it is longer."""
-    magnitude = np.linalg.norm(vector)
-    if magnitude > max_magnitude:
-        vector = vector / np.linalg.norm(vector) * max_magnitude
+def limit_vector(vector: np.ndarray | tuple[float, float], max_magnitude: float) -> np.ndarray | tuple[float, float]:
+    """Shortens the magnitude of the vector to the max_magnitude if it is longer.
+
+    Accepts any unpackable 2-vector (tuple, ndarray, Vec2d), so per-tick callers don't have to allocate an ndarray
+    first. The common case of a vector already below the limit is returned untouched, without any sqrt or allocation.
+    """
+    x, y = vector
+    magnitude_squared = x * x + y * y
+    if magnitude_squared > max_magnitude * max_magnitude:
+        scale = max_magnitude / math.sqrt(magnitude_squared)
+        return x * scale, y * scale
     return vector
 
 
@@ -60,16 +89,13 @@ def smallest_angle_difference(angle_1: float, angle_2: float) -> float:
     return (angle_2 - angle_1 + 180) % 360 - 180
 
 
-def polygon_area(points: tuple[float, float]):
+def polygon_area(points: tuple[tuple[float, float], ...]) -> float:
     """Compute area of polygon using the shoelace formula.
        Points must be in order (clockwise or counterclockwise)."""
-    n = len(points)
-    area = 0.0
-    for i in range(n):
-        x1, y1 = points[i]
-        x2, y2 = points[(i + 1) % n]
-        area += x1 * y2 - x2 * y1
-    return abs(area) / 2
+    points = np.asarray(points, dtype=float)
+    x = points[:, 0]
+    y = points[:, 1]
+    return abs(x @ np.roll(y, -1) - np.roll(x, -1) @ y) / 2
 
 
 def sphere_volume_from_circle_area(area):
@@ -83,4 +109,4 @@ def sphere_volume_from_circle_area(area):
     Returns:
         float: Volume of the sphere
     """
-    return (4 / 3) * (area ** 1.5) / math.sqrt(math.pi)
+    return (4 / 3) * (area ** 1.5) / _SQRT_PI
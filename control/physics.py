@@ -1,3 +1,4 @@
+import math
 from contextlib import contextmanager
 from typing import Callable
 
@@ -5,7 +6,7 @@ import numpy as np
 from arcade import PymunkPhysicsEngine
 from pymunk import Vec2d
 
-from control.math_utils import smallest_angle_difference, vector_from_angle_magnitude, rotate_vector_2d
+from control.math_utils import vector_from_angle_magnitude
 
 import model
 
@@ -18,19 +19,25 @@ class PhysicsEngine(PymunkPhysicsEngine):
         super().__init__(gravity=gravity, damping=damping)
         self.entity = None
         self.physics_object = None
+        self.body = None
 
     @contextmanager
     def set_current_entity(self, entity: "model.entities.PhysicalEntity"):
-        """Set a specific entity to be manipulated."""  # todo make this a context manager.
+        """Set a specific entity to be manipulated."""
         self.entity = entity
         self.physics_object = self.get_physics_object(entity)
-        yield
-        self.entity = None
-        self.physics_object = None
+        self.body = self.physics_object.body  # cached, the body is dereferenced several times per activation
+        try:
+            yield
+        finally:
+            # always unbind, otherwise an exception in the with-body leaves a stale entity set
+            self.entity = None
+            self.physics_object = None
+            self.body = None
 
     def get_translational_speed(self) -> Vec2d:
         """Return the translational speed vector of the entity."""
-        return self.physics_object.body.velocity
+        return self.body.velocity
 
     def get_velocity(self) -> float:
         """Return the translational speed of the entity."""
@@ -38,21 +45,29 @@ class PhysicsEngine(PymunkPhysicsEngine):
 
     def set_translational_speed(self, velocity: tuple[float, float]):
         """Set the translational speed of the entity."""
-        self.physics_object.body.velocity = velocity
+        self.body.velocity = velocity
+
+    def get_speeds(self) -> tuple[Vec2d, float]:
+        """Return the translational and rotational speed of the entity with a single body access.
+
+        See get_rotational_speed for why the angular velocity is negated.
+        """
+        body = self.body
+        return body.velocity, -body.angular_velocity
 
     def get_rotational_speed(self) -> float:
         """Return the rotational speed of the entity. Positive numbers will rotate clockwise.
 
         Note that Pymunk uses the opposite orientation. Hence, the - in the code below.
         """
-        return -self.physics_object.body.angular_velocity
+        return -self.body.angular_velocity
 
     def set_rotational_speed(self, velocity: float):
         """Set the rotational speed of the entity. Positive numbers will rotate clockwise.
 
         Note that Pymunk uses the opposite orientation. Hence, the - in the code below.
         """
-        self.physics_object.body.angular_velocity = -velocity
+        self.body.angular_velocity = -velocity
 
     def relative_move(self, angle: float, magnitude: float):
         """Move in a direction relative to the current position with.
@@ -63,15 +78,20 @@ class PhysicsEngine(PymunkPhysicsEngine):
         impulse = vector_from_angle_magnitude(angle, magnitude)
         self.relative_move_impulse(impulse)
 
-    def relative_move_impulse(self, impulse: np.ndarray):
+    def relative_move_impulse(self, impulse: np.ndarray | tuple[float, float]):
         """Gets an impulse to move in a direction relative to the current position, but global orientation.
 
         Pymunk's apply_impulse() also applies the impuls based on the entities orientation, which is why we rotate it
         before.
         """
-        pymunk_impulse = rotate_vector_2d(impulse, -self.entity.angle)
-        self.apply_impulse(self.entity, tuple(pymunk_impulse))  # noqa
-        if np.allclose(self.get_translational_speed(), (0, 0), atol=0.01):
+        # inlined rotate_vector_2d by -entity.angle, keeping the impulse as plain scalars end to end
+        angle_rad = math.radians(self.entity.angle)
+        cos = math.cos(angle_rad)
+        sin = math.sin(angle_rad)
+        x, y = impulse
+        self.apply_impulse(self.entity, (cos * x - sin * y, sin * x + cos * y))  # noqa
+        velocity = self.get_translational_speed()
+        if abs(velocity.x) <= 0.01 and abs(velocity.y) <= 0.01:
             # this handles the problem, that it is nearly impossible to completely stop the ship. Which is realistic,
             # but feels bad during play.
             self.set_translational_speed((0, 0))
@@ -96,26 +116,29 @@ class PhysicsEngine(PymunkPhysicsEngine):
         :param max_rotation_acceleration: The strongest possible rotational impulse.
         """
         assert -180 <= angle < 180, "angle has to be in the interval [-180, 180)"
-        if angle == 0 and self.get_rotational_speed() == 0:
+        rotational_speed = self.get_rotational_speed()
+        if angle == 0 and rotational_speed == 0:
             return 0  # nothing to do
 
+        # plain scalar math on purpose: np.sign/np.isclose on single floats cost hundreds of ns in dispatch
+        speed_direction = (rotational_speed > 0) - (rotational_speed < 0)
         highest_possible_momentum_change = max_rotation_acceleration * self.entity.rotation_inertia
-        new_rotation_momentum = self.get_rotational_speed() + highest_possible_momentum_change * np.sign(self.get_rotational_speed())
+        new_rotation_momentum = rotational_speed + highest_possible_momentum_change * speed_direction
         new_time_to_stop_in_ticks = abs(new_rotation_momentum) / highest_possible_momentum_change
         new_breaking_distance_in_degrees = self.stopping_distance(new_rotation_momentum, new_time_to_stop_in_ticks, highest_possible_momentum_change)
 
-        if np.isclose(angle, 0, atol=0.001) and abs(self.get_rotational_speed()) <= highest_possible_momentum_change:
+        if abs(angle) <= 0.001 and abs(rotational_speed) <= highest_possible_momentum_change:
             # when very close to the target, perfectly stop momentum and orientation
-            magnitude = -self.get_rotational_speed() / self.entity.rotation_inertia  # todo is that still correct with Pymunk?
+            magnitude = -rotational_speed / self.entity.rotation_inertia  # todo is that still correct with Pymunk?
             if angle != 0:
                 self.entity.angle += angle
         elif abs(angle) <= new_breaking_distance_in_degrees:  # time to de-accelerate?
-            if abs(self.get_rotational_speed()) >= 1 * highest_possible_momentum_change:
-                magnitude = -1 * np.sign(self.get_rotational_speed()) * max_rotation_acceleration
+            if abs(rotational_speed) >= 1 * highest_possible_momentum_change:
+                magnitude = -speed_direction * max_rotation_acceleration
             else:
                 if abs(angle) < highest_possible_momentum_change:
                     # reduce the magnitude for the final tick to land on the target angle
-                    magnitude = (-1 * np.sign(self.get_rotational_speed()) * max_rotation_acceleration * (
+                    magnitude = (-speed_direction * max_rotation_acceleration * (
                         (highest_possible_momentum_change - abs(angle)) / highest_possible_momentum_change))
                 else:
                     magnitude = 0
@@ -133,10 +156,12 @@ class PhysicsEngine(PymunkPhysicsEngine):
          :return: -1 for counterclockwise and 1 for clockwise. If target_angle is 0, returns the direction of the
             current rotation speed.
          """
-        if target_angle == 0:
-            return np.sign(self.get_rotational_speed())
+        direction = (target_angle > 0) - (target_angle < 0)
+        if direction:
+            return direction
 
-        return np.sign(target_angle)
+        rotational_speed = self.get_rotational_speed()
+        return (rotational_speed > 0) - (rotational_speed < 0)
 
     @staticmethod
     def stopping_distance(starting_moment: float, num_ticks: float, highest_possible_momentum_change: float):
@@ -144,9 +169,11 @@ class PhysicsEngine(PymunkPhysicsEngine):
          highest_possible_momentum_change.
         """
         starting_moment = abs(starting_moment)
-        return sum(starting_moment - highest_possible_momentum_change * t for t in
-                   range(int(num_ticks))) + (
-                num_ticks % 1) * highest_possible_momentum_change
+        # the per-tick decelerations form an arithmetic progression, so the sum has a closed form
+        num_full_ticks = int(num_ticks)
+        full_ticks_distance = (num_full_ticks * starting_moment
+                               - highest_possible_momentum_change * num_full_ticks * (num_full_ticks - 1) / 2)
+        return full_ticks_distance + (num_ticks % 1) * highest_possible_momentum_change
 
     def absolute_rotation(self, angle: float, max_rotation_acceleration: float = 1):
         """Change the momentum to turn the entity towards the angle in a way to perfectly stopping at the angle with 0
@@ -155,17 +182,18 @@ class PhysicsEngine(PymunkPhysicsEngine):
         :param angle: Relative orientation change in degrees to move towards in [0, 360) clockwise with 0 is up.
         :param max_rotation_acceleration: The strongest possible rotational impulse.
         """
-        relative_angle = smallest_angle_difference(self.entity.angle, angle)
+        # inlined smallest_angle_difference, this runs every tick while the autopilot holds a heading
+        relative_angle = (angle - self.entity.angle + 180) % 360 - 180
         magnitude = self.get_relative_rotation_magnitude(relative_angle, max_rotation_acceleration)
         self.relative_rotation(magnitude)
         return magnitude
 
     def set_rotational_inertia(self, value: float):  # todo I am a bit confused. Pymunk makes it sound like this is only inertia, but going deeper it looks like both
-        # self.physics_object.body._set_moment(value)
-        self.physics_object.body.moment = value
+        # self.body._set_moment(value)
+        self.body.moment = value
 
     def get_rotational_inertia(self) -> float:  # todo I am a bit confused. Pymunk makes it sound like this is only inertia, but going deeper it looks like both
-        return self.physics_object.body.moment
+        return self.body.moment
 
     def add_wildcard_collision_handler(self, collision_type: str, begin_handler: Callable | None = None,
                                        pre_handler: Callable | None = None, post_handler: Callable | None = None,
@@ -178,38 +206,38 @@ class PhysicsEngine(PymunkPhysicsEngine):
         :param post_handler: Function to call after a collision is resolved.
         :param separate_handler: Function to call when two objects
         """
-        if collision_type not in self.collision_types:
+        try:
+            collision_type_index = self.collision_types.index(collision_type)
+        except ValueError:
             self.collision_types.append(collision_type)
-        collision_type_index = self.collision_types.index(collision_type)
+            collision_type_index = len(self.collision_types) - 1
 
+        # the wrappers are only built for handlers that were actually passed, so the per-collision calls don't pay
+        # for re-checking which handlers exist
         handler = self.space.add_wildcard_collision_handler(collision_type_index)
-        def _f1(arbiter, space, data):
-            sprite_a, sprite_b = self.get_sprites_from_arbiter(arbiter)
-            should_process_collision = False
-            if sprite_a is not None and sprite_b is not None and begin_handler is not None:
-                should_process_collision = begin_handler(sprite_a, sprite_b, arbiter, space, data)
-            return should_process_collision
-
-        def _f2(arbiter, space, data):
-            sprite_a, sprite_b = self.get_sprites_from_arbiter(arbiter)
-            if sprite_a is not None and sprite_b is not None and post_handler is not None:
-                post_handler(sprite_a, sprite_b, arbiter, space, data)
-
-        def _f3(arbiter, space, data):
-            sprite_a, sprite_b = self.get_sprites_from_arbiter(arbiter)
-            if pre_handler is not None:
-                return pre_handler(sprite_a, sprite_b, arbiter, space, data)
-
-        def _f4(arbiter, space, data):
-            sprite_a, sprite_b = self.get_sprites_from_arbiter(arbiter)
-            if separate_handler:
-                separate_handler(sprite_a, sprite_b, arbiter, space, data)
-
         if begin_handler:
-            handler.begin = _f1
+            def _begin(arbiter, space, data):
+                sprite_a, sprite_b = self.get_sprites_from_arbiter(arbiter)
+                if sprite_a is None or sprite_b is None:
+                    return False
+                return begin_handler(sprite_a, sprite_b, arbiter, space, data)
+            handler.begin = _begin
+
         if post_handler:
-            handler.post_solve = _f2
+            def _post(arbiter, space, data):
+                sprite_a, sprite_b = self.get_sprites_from_arbiter(arbiter)
+                if sprite_a is not None and sprite_b is not None:
+                    post_handler(sprite_a, sprite_b, arbiter, space, data)
+            handler.post_solve = _post
+
         if pre_handler:
-            handler.pre_solve = _f3
+            def _pre(arbiter, space, data):
+                sprite_a, sprite_b = self.get_sprites_from_arbiter(arbiter)
+                return pre_handler(sprite_a, sprite_b, arbiter, space, data)
+            handler.pre_solve = _pre
+
         if separate_handler:
-            handler.separate = _f4
+            def _separate(arbiter, space, data):
+                sprite_a, sprite_b = self.get_sprites_from_arbiter(arbiter)
+                separate_handler(sprite_a, sprite_b, arbiter, space, data)
+            handler.separate = _separate
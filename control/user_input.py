@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class UserInput:
     """Contains the current user inputs that effect the world. The user's inputs will be read periodically during the
      update loop.
@@ -1,5 +1,7 @@
 """A simple GUI for testing using Arcade for rendering and Pygame for input."""
+import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 import arcade
@@ -8,12 +10,32 @@ import numpy as np
 from pygame.joystick import JoystickType
 
 from control.math_utils import get_point_angle
-from model.entities import Combatant
 from model.worlds import World
 from control.main import GameControl
 from settings import GameSettings
 
 
+# movement keys all set a single UserInput attribute, so they dispatch through one dict lookup instead of a case chain
+_KEY_PRESS_MOVEMENT = {
+    arcade.key.LEFT: ("movement_width", -1),
+    arcade.key.A: ("movement_width", -1),
+    arcade.key.RIGHT: ("movement_width", 1),
+    arcade.key.D: ("movement_width", 1),
+    arcade.key.UP: ("movement_height", 1),
+    arcade.key.W: ("movement_height", 1),
+    arcade.key.DOWN: ("movement_height", -1),
+    arcade.key.S: ("movement_height", -1),
+}
+_KEY_RELEASE_MOVEMENT = {key: (attribute, 0) for key, (attribute, _) in _KEY_PRESS_MOVEMENT.items()}
+
+
+@lru_cache(maxsize=None)
+def _read_shader_source(file_name: str) -> str:
+    """Read a shader file. Cached, the sources don't change at runtime, so re-creating the GUI skips the disk reads."""
+    with open(file_name) as file:
+        return file.read()
+
+
 @dataclass(kw_only=True)
 class Settings:
     """Has the GUI settings."""
@@ -36,6 +58,9 @@ class GUI(arcade.Window):
         self.camera = arcade.Camera2D()
         self.sprite_list = self.world.entities
         self.joystick = self.setup_joystick()
+        # resolved once, the polling loop runs every frame
+        self._drift_thresh = GameSettings.min_drift_strength
+        self._joystick_has_burst_axis = self.joystick.get_numaxes() > 4 if self.joystick else False
 
         arcade.enable_timings()
 
@@ -48,17 +73,17 @@ class GUI(arcade.Window):
         self.ctx.enable(self.ctx.BLEND)
 
     def _load_shaders(self):
-        """Load the shader files."""
-        file_name = "gui/shader/star_nest.glsl"
-        with open(file_name) as file:
-            shader_source = file.read()
-            self.background_shader = arcade.experimental.Shadertoy(size=self.get_size(), main_source=shader_source)
-
-        file_name = "gui/shader/shield.glsl"
-        with open(file_name) as file:
-            shader_source = file.read()
-            self.shield_shader = arcade.experimental.Shadertoy(size=self.get_size(), main_source=shader_source)
-            self.shield_shader.program['color'] = arcade.color.ALLOY_ORANGE.normalized
+        """Load the shader files.
+
+        Only the source reads are cached; the compiled programs belong to this window's GL context and cannot be
+        shared across GUI instances.
+        """
+        shader_source = _read_shader_source("gui/shader/star_nest.glsl")
+        self.background_shader = arcade.experimental.Shadertoy(size=self.get_size(), main_source=shader_source)
+
+        shader_source = _read_shader_source("gui/shader/shield.glsl")
+        self.shield_shader = arcade.experimental.Shadertoy(size=self.get_size(), main_source=shader_source)
+        self.shield_shader.program['color'] = arcade.color.ALLOY_ORANGE.normalized
 
     @staticmethod
     def setup_joystick() -> Optional[JoystickType]:
@@ -76,45 +101,28 @@ class GUI(arcade.Window):
 
         Note: steering only works when no joystick is active, as that will override the keyboard input.
         """
-        match key:
-            case arcade.key.LEFT | arcade.key.A:
-                self.control.user_input.movement_width = -1
-            case arcade.key.RIGHT | arcade.key.D:
-                self.control.user_input.movement_width = 1
-            case arcade.key.UP | arcade.key.W:
-                self.control.user_input.movement_height = 1
-            case arcade.key.DOWN | arcade.key.S:
-                self.control.user_input.movement_height = -1
-            case arcade.key.Q:
-                self.control.user_input.orientation = (self.world.player.angle - 179) % 360
-                self.control.user_input.orientation_strength = 1
-            case arcade.key.E:
-                self.control.user_input.orientation = (self.world.player.angle + 179) % 360
-                self.control.user_input.orientation_strength = 1
-            case arcade.key.ESCAPE:
-                self.close()
-            case arcade.key.R:
-                self.control.user_input.respawn = True
-            case arcade.key.H:
-                Settings.draw_hitbox = not Settings.draw_hitbox
+        if movement := _KEY_PRESS_MOVEMENT.get(key):
+            setattr(self.control.user_input, movement[0], movement[1])
+        elif key == arcade.key.Q:
+            self.control.user_input.orientation = (self.world.player.angle - 179) % 360
+            self.control.user_input.orientation_strength = 1
+        elif key == arcade.key.E:
+            self.control.user_input.orientation = (self.world.player.angle + 179) % 360
+            self.control.user_input.orientation_strength = 1
+        elif key == arcade.key.ESCAPE:
+            self.close()
+        elif key == arcade.key.R:
+            self.control.user_input.respawn = True
+        elif key == arcade.key.H:
+            Settings.draw_hitbox = not Settings.draw_hitbox
 
     def on_key_release(self, key, modifiers):
         """Called when the user releases a key. """
-        match key:
-            case arcade.key.LEFT | arcade.key.A:
-                self.control.user_input.movement_width = 0
-            case arcade.key.RIGHT | arcade.key.D:
-                self.control.user_input.movement_width = 0
-            case arcade.key.UP | arcade.key.W:
-                self.control.user_input.movement_height = 0
-            case arcade.key.DOWN | arcade.key.S:
-                self.control.user_input.movement_height = 0
-            case arcade.key.Q:
-                self.control.user_input.orientation = 0
-                self.control.user_input.orientation_strength = 0
-            case arcade.key.E:
-                self.control.user_input.orientation = 0
-                self.control.user_input.orientation_strength = 0
+        if movement := _KEY_RELEASE_MOVEMENT.get(key):
+            setattr(self.control.user_input, movement[0], movement[1])
+        elif key == arcade.key.Q or key == arcade.key.E:
+            self.control.user_input.orientation = 0
+            self.control.user_input.orientation_strength = 0
 
     def on_update(self, delta_time: float = None):
         """Notes:
@@ -144,46 +152,52 @@ class GUI(arcade.Window):
         There is no event method like for the mouse or keyboard for joysticks. Which is why this method is called during
         on_update().
         """
-        if self.joystick:
-            drift_thresh = GameSettings.min_drift_strength
+        joystick = self.joystick
+        if joystick:
+            drift_thresh = self._drift_thresh
+            user_input = self.control.user_input
             pygame.event.pump()
             # Move player (left stick)
-            self.control.user_input.movement_width = self.suppress_activation(self.joystick.get_axis(0), drift_thresh)
-            self.control.user_input.movement_height = -self.suppress_activation(self.joystick.get_axis(1), drift_thresh)
-            r2 = self.joystick.get_axis(5) if self.joystick.get_numaxes() > 4 else self.joystick.get_button(8)
-            self.control.user_input.burst = r2  # todo Check the axes version. Is it between -1 and 1? what is not pressed?
-            if self.control.user_input.burst > 0.1:
-                self.joystick.rumble(1, 0, 1000)  # todo the test controller seems to only support on and off and only uses one motor
+            user_input.movement_width = self.suppress_activation(joystick.get_axis(0), drift_thresh)
+            user_input.movement_height = -self.suppress_activation(joystick.get_axis(1), drift_thresh)
+            r2 = joystick.get_axis(5) if self._joystick_has_burst_axis else joystick.get_button(8)
+            user_input.burst = r2  # todo Check the axes version. Is it between -1 and 1? what is not pressed?
+            if user_input.burst > 0.1:
+                joystick.rumble(1, 0, 1000)  # todo the test controller seems to only support on and off and only uses one motor
             else:
-                self.joystick.stop_rumble()
-            self.control.user_input.stabilize = self.joystick.get_button(6)  # R1
+                joystick.stop_rumble()
+            user_input.stabilize = joystick.get_button(6)  # R1
 
             # Rotation (right stick)
-            right_joystick_x = self.suppress_activation(self.joystick.get_axis(2), drift_thresh)
-            right_joystick_y = -self.suppress_activation(self.joystick.get_axis(3), drift_thresh)  # inverted
-            self.control.user_input.orientation = get_point_angle(right_joystick_x, right_joystick_y)
-            self.control.user_input.orientation_strength = np.sqrt(right_joystick_x**2 + right_joystick_y**2)
+            right_joystick_x = self.suppress_activation(joystick.get_axis(2), drift_thresh)
+            right_joystick_y = -self.suppress_activation(joystick.get_axis(3), drift_thresh)  # inverted
+            user_input.orientation = get_point_angle(right_joystick_x, right_joystick_y)
+            user_input.orientation_strength = math.hypot(right_joystick_x, right_joystick_y)
 
             # weapons
-            if self.joystick.get_button(5):  # L1
-                self.control.user_input.fire_rail_guns = True
+            if joystick.get_button(5):  # L1
+                user_input.fire_rail_guns = True
 
-            if self.joystick.get_button(7):  # L2
-                self.control.user_input.fire_lasers = True
+            if joystick.get_button(7):  # L2
+                user_input.fire_lasers = True
 
             # Zoom
-            if self.joystick.get_button(13):  # down
+            if joystick.get_button(13):  # down
                 self.settings.zoom = max(0.2, min(2.0, self.settings.zoom * 0.95))
-            elif self.joystick.get_button(12):  # up
+            elif joystick.get_button(12):  # up
                 self.settings.zoom = max(0.2, min(2.0, self.settings.zoom * 1.05))
 
     @staticmethod
     def suppress_activation(value: float, thresh: float):
-        """Reduce the value to 0 if it is smaller than the thresh. Useful e.g. to handle stick drifts..."""
-        if abs(value) >= thresh:
-            return value
-        else:
-            return 0
+        """Apply a deadzone to the value. Useful e.g. to handle stick drifts...
+
+        The range above the deadzone is rescaled to start from 0, so there is no sudden jump in the response when
+        the stick crosses the threshold.
+        """
+        magnitude = abs(value)
+        if magnitude < thresh:
+            return 0.
+        return math.copysign(min((magnitude - thresh) / (1. - thresh), 1.), value)
 
     def on_draw(self):
         self.clear()
@@ -193,9 +207,9 @@ class GUI(arcade.Window):
         mouse_pos = (0, 0)  # self.mouse["x"], self.mouse["y"]
         self.background_shader.render(time=self.time, mouse_position=mouse_pos)
 
-        # draw shields
-        for sprite in self.sprite_list:
-            if isinstance(sprite, Combatant) and sprite.shields.activity_level:
+        # draw shields; only combatants have them, so iterate the world's combatant bucket
+        for sprite in self.world.combatants:
+            if sprite.shields.activity_level:
                 color = np.array(self.shield_shader.program['color']) * 255
                 if Settings.draw_hitbox:
                     color[-1] = sprite.shields.activity_level * 255
@@ -210,8 +224,7 @@ class GUI(arcade.Window):
         # Draw sprites
         self.sprite_list.draw()
         if Settings.draw_hitbox:
-            for sprite in self.sprite_list:
-                sprite.draw_hit_box(color=arcade.color.LIME_GREEN, line_thickness=2)
+            self.sprite_list.draw_hit_boxes(color=arcade.color.LIME_GREEN, line_thickness=2)
 
         # Draw world borders
         self.world.walls.draw()
@@ -231,7 +244,7 @@ class GUI(arcade.Window):
 
     def draw_energy_bar(self):
         """Show the current power level."""
-        energy_fraction = self.world.player.reactor.capacitors_storage / self.world.player.reactor.capacitors_limit
+        energy_fraction = self.world.player.reactor.energy_fraction
         bar_width = 30
         max_bar_height = 200
         x, y = self.camera.center_right
@@ -240,12 +253,12 @@ class GUI(arcade.Window):
 
     def draw_hp_bar(self):
         """Show the current hp level."""
-        energy_fraction = self.world.player.structure.hp / self.world.player.structure.max_hp
+        hp_fraction = self.world.player.structure.hp_fraction
         bar_width = 30
         max_bar_height = 200
         x, y = self.camera.center_right
         x -= bar_width * 2
-        self.draw_bar(x, y, bar_width, max_bar_height, arcade.color.GREEN, energy_fraction)
+        self.draw_bar(x, y, bar_width, max_bar_height, arcade.color.GREEN, hp_fraction)
 
     @staticmethod
     def draw_bar(left: float, bottom: float, bar_width: float, max_bar_height: float, color: tuple[int, int, int],
@@ -30,11 +30,15 @@ class AsteroidSizes(StrEnum):
 
     @staticmethod
     def get_smallest_size() -> "AsteroidSizes":
-        return [size for size in AsteroidSizes][0]
+        return _ASTEROID_SIZES_ORDERED[0]
 
     @staticmethod
     def get_smaller_sizes(size: "AsteroidSizes") -> list["AsteroidSizes"]:
         """Returns a list of all Asteroid sizes smaller than the given size."""
-        all_sizes = [size for size in AsteroidSizes]
-        cutoff_index = all_sizes.index(size)
-        return all_sizes[0:cutoff_index]
+        return _SMALLER_ASTEROID_SIZES[size]
+
+
+_ASTEROID_SIZES_ORDERED: Final[tuple["AsteroidSizes", ...]] = tuple(AsteroidSizes)
+_SMALLER_ASTEROID_SIZES: Final[dict["AsteroidSizes", list["AsteroidSizes"]]] = {
+    size: list(_ASTEROID_SIZES_ORDERED[:index]) for index, size in enumerate(_ASTEROID_SIZES_ORDERED)
+}
@@ -1,4 +1,5 @@
 """Contains the objects."""
+from functools import lru_cache
 from typing import Self, Callable
 
 import numpy as np
@@ -42,10 +43,14 @@ class WorldBorder(arcade.SpriteSolidColor):
         ])
         return walls
 
-    @staticmethod
-    def get_physics() -> dict:
+    _physics: dict | None = None  # all walls share the same static parameters, so the dict is built only once
+
+    @classmethod
+    def get_physics(cls) -> dict:
         """Returns all parameters needed by the physics engine in a neat dictionary."""
-        return {
+        if cls._physics is not None:
+            return cls._physics
+        cls._physics = {
             "mass": 1,
             "moment_of_inertia": PymunkPhysicsEngine.MOMENT_INF,
             "friction": 0,
@@ -59,6 +64,18 @@ class WorldBorder(arcade.SpriteSolidColor):
             "radius": 0,
             "collision_type": WorldBorder.collision_type_name
         }
+        return cls._physics
+
+
+@lru_cache(maxsize=None)
+def _estimate_texture_volume(texture: arcade.Texture) -> float:
+    """Estimate the volume of the object shown by the texture from its hit box.
+
+    Cached per texture object; entities sharing a texture (e.g. asteroids of the same look) skip the polygon math
+    on spawn.
+    """
+    area = math_utils.polygon_area(texture.hit_box_points)
+    return math_utils.sphere_volume_from_circle_area(area)
 
 
 class PhysicalEntity(Sprite):
@@ -96,8 +113,7 @@ class PhysicalEntity(Sprite):
             is completely solid with no empty spaces within.
         """
         weight = MATERIAL_WEIGHT[material] if isinstance(material, str) else material
-        area = math_utils.polygon_area(self.texture.hit_box_points)  # noqa
-        volume = math_utils.sphere_volume_from_circle_area(area)
+        volume = _estimate_texture_volume(self.texture)
         return volume * weight * solidity_fraction
 
 
@@ -134,8 +150,11 @@ class PhysicalEntity(Sprite):
     @angle.setter
     def angle(self, new_value: float) -> None:
         """Added functionality of limiting the nagle to [0, 360)"""
-        new_value = new_value % 360
-        if new_value == self._angle:
+        # float() keeps a np.float64 from slipping in, whose % would dispatch through NumPy on every set
+        new_value = float(new_value) % 360
+        # skip the hit box, GL buffer and spatial hash updates for sub-visible rotations (wrap-aware, so
+        # 359.999 -> 0.0 also counts as tiny); at 0.01° the rendered sprite and collisions are unaffected
+        if abs((new_value - self._angle + 180) % 360 - 180) < 0.01:
             return
 
         self._angle = new_value
@@ -151,6 +170,31 @@ class PhysicalEntity(Sprite):
         self.remove_from_sprite_lists()
 
 
+@lru_cache(maxsize=None)
+def _load_asteroid_texture(size: AsteroidSizes, image_number: int, flips: int = 0) -> arcade.Texture:
+    """Load the texture for an asteroid. Cached, so all asteroids of the same look share one texture and the flip
+    variants (each of which reruns the detailed hit-box computation) are only ever built once.
+
+    :param flips: 5-bit mask selecting which texture flips to apply, one bit per flip axis.
+    """
+    if flips:
+        texture = _load_asteroid_texture(size, image_number)
+        if flips & 1:
+            texture = texture.flip_diagonally()
+        if flips & 2:
+            texture = texture.flip_vertically()
+        if flips & 4:
+            texture = texture.flip_left_right()
+        if flips & 8:
+            texture = texture.flip_horizontally()
+        if flips & 16:
+            texture = texture.flip_top_bottom()
+        return texture
+
+    return arcade.load_texture(f":resources:images/space_shooter/meteorGrey_{size}{image_number}.png",
+                               hit_box_algorithm=arcade.hitbox.algo_detailed)
+
+
 class Asteroid(PhysicalEntity):
     """A simple peace of rock floating through space."""
     size_to_default_mass = {
@@ -166,19 +210,9 @@ class Asteroid(PhysicalEntity):
         self.size_class = size
 
         image_number = np.random.randint(1, (4 if size == AsteroidSizes.big else 2) + 1)
-        texture = arcade.load_texture(f":resources:images/space_shooter/meteorGrey_{size}{image_number}.png",
-                                      hit_box_algorithm=arcade.hitbox.algo_detailed)
+        flips = int(np.random.randint(32))  # one draw decides all five texture flips, one bit each
+        texture = _load_asteroid_texture(size, int(image_number), flips)
         scale = scale or np.random.random() + 0.5 # todo scale width and height independently. But that somehow messes up Pymunk collision detection
-        if np.random.random() < 0.5:
-            texture = texture.flip_diagonally()
-        if np.random.random() < 0.5:
-            texture = texture.flip_vertically()
-        if np.random.random() < 0.5:
-            texture = texture.flip_left_right()
-        if np.random.random() < 0.5:
-            texture = texture.flip_horizontally()
-        if np.random.random() < 0.5:
-            texture = texture.flip_top_bottom()
 
         mass = kwargs.pop("mass", None) or self.size_to_default_mass[size] * scale**2
 
@@ -193,13 +227,13 @@ class Asteroid(PhysicalEntity):
 
         with self.physics_engine.set_current_entity(self):
             mass = self.mass  * 0.9
-            velocity = self.physics_engine.get_translational_speed()
-            rotational_speed = self.physics_engine.get_rotational_speed()
+            velocity, rotational_speed = self.physics_engine.get_speeds()
         self.remove_from_sprite_lists()
 
         # todo add some particle cloud effect to cover the split
+        smaller_sizes = AsteroidSizes.get_smaller_sizes(self.structure.size)
         while mass >= self.size_to_default_mass[AsteroidSizes.tiny]:
-            size = np.random.choice(AsteroidSizes.get_smaller_sizes(self.structure.size))
+            size = smaller_sizes[np.random.randint(len(smaller_sizes))]
             new_asteroid = add_entity_func(
                 Asteroid, {"size": size, "center_x": self.center_x, "center_y": self.center_y,
                            "translational_speed": velocity, "rotational_speed": rotational_speed,
@@ -223,26 +257,27 @@ class Combatant(PhysicalEntity):
         self.sensor = Sensor(entity=self)
         self.shields = Shields(entity=self)
 
+    # maps a base system class to the attribute its upgrades are stored in
+    _SYSTEM_SLOTS: dict[type[System], str] = {
+        Reactor: "reactor",
+        Engine: "engine",
+        Structure: "structure",
+        Railgun: "railgun",
+        Sensor: "sensor",
+        Shields: "shields",
+    }
+
     def upgrade(self, system: type[System], system_parameter: dict = None) -> Self:
         """Replaces an old system with a new one."""
         system_parameter = system_parameter or {}
         system_object = system(entity=self, **system_parameter)
-        if issubclass(system, Reactor):
-            self.reactor = system_object
-        elif issubclass(system, Engine):
-            self.engine = system_object
-        elif issubclass(system, Structure):
-            self.structure = system_object
-        elif issubclass(system, Railgun):
-            self.railgun = system_object
-        elif issubclass(system, Sensor):
-            self.sensor = system_object
-        elif issubclass(system, Shields):
-            self.shields = system_object
-        else:
-            raise ValueError(f"Unknown System class {type(system)}.")
-
-        return self
+        # the mro walk finds the most specific base system, replacing the old issubclass ladder
+        for base_class in system.__mro__:
+            if slot := self._SYSTEM_SLOTS.get(base_class):
+                setattr(self, slot, system_object)
+                return self
+
+        raise ValueError(f"Unknown System class {type(system)}.")
 
 
 class Player(Combatant):
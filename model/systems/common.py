@@ -1,4 +1,3 @@
-from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import StrEnum, auto
 
@@ -12,7 +11,7 @@ class SystemEvent:
     time: int
 
 @dataclass(kw_only=True)
-class System(ABC):
+class System:
     """Baseclass for all systems.
 
     :param name: Name of the system
@@ -22,10 +21,9 @@ class System(ABC):
     entity: "Combatant"
     events: list[SystemEvent] = field(default_factory=list)
 
-    @abstractmethod
     def activate(self, *args, **kwargs):
         """Activates the systems function. This is called every tick. The effects depend on the system."""
-        raise NotImplemented("abstract method")
+        raise NotImplementedError("activate() must be implemented by the concrete system")
 
     @property
     def physics_engine(self) -> PhysicsEngine:
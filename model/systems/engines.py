@@ -1,3 +1,4 @@
+import math
 from dataclasses import dataclass
 from typing import Optional
 
@@ -131,7 +132,8 @@ class Engine(System):
         input_strength = self.relative_movement_strength(user_input)
         if self.entity.reactor.power(self.energy_maneuver * input_strength, self):
             self.is_maneuvering_thruster_active = True
-            user_input_direction = np.array((user_input.movement_width, user_input.movement_height))
+            # a plain tuple is enough here, limit_vector and relative_move_impulse only ever unpack the vector
+            user_input_direction = (user_input.movement_width, user_input.movement_height)
             impulse = limit_vector(user_input_direction, self.max_maneuver_acceleration * input_strength)
             self.physics_engine.relative_move_impulse(impulse)
 
@@ -147,7 +149,7 @@ class Engine(System):
     @staticmethod
     def relative_movement_strength(user_input: UserInput) -> float:
         """Converts the relative movement command to the strength (vector length)."""
-        return np.sqrt(user_input.movement_width**2 + user_input.movement_height**2)
+        return math.hypot(user_input.movement_width, user_input.movement_height)
 
 @dataclass
 class TestShipEngine(Engine):
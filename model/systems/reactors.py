@@ -44,6 +44,11 @@ class Reactor(System):
 
         self.capacitors_storage = min(self.capacitors_limit, max(0., self.capacitors_storage + energy_production))
 
+    @property
+    def energy_fraction(self) -> float:
+        """The fill level of the capacitors in [0, 1]."""
+        return self.capacitors_storage / self.capacitors_limit if self.capacitors_limit else 0.
+
     def power(self, cost: float, source: System = None) -> bool:
         """Used to power a device. Returns a bool if there was enough energy."""
         if self.status == Status.destroyed:
@@ -9,4 +9,4 @@ class Sensor(System):
     name: str = "Sensor"
 
     def activate(self, *args, **kwargs):
-        raise NotImplemented
+        raise NotImplementedError
@@ -30,6 +30,11 @@ class Structure(System):
     def hp(self, value: float):
         self._hp = min(max(0., value), self.max_hp)
 
+    @property
+    def hp_fraction(self) -> float:
+        """The remaining hp as a fraction of max_hp in [0, 1]."""
+        return self._hp / self.max_hp if self.max_hp else 0.
+
     def activate(self, *args, **kwargs):
         """Activate structure abilities like self-healing."""
         self.time_left_invulnerable = max(0., self.time_left_invulnerable - 1 / GameSettings.simulation_speed)
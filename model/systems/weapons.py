@@ -50,4 +50,4 @@ class Lasers(System):
     name: str = "Lasers"
 
     def activate(self, *args, **kwargs):
-        raise NotImplemented
+        raise NotImplementedError
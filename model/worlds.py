@@ -7,7 +7,7 @@ from pymunk import Arbiter, Space
 
 from control.physics import PhysicsEngine
 from model.common import AsteroidSizes
-from model.entities import Player, Asteroid, WorldBorder, PhysicalEntity, Projectile
+from model.entities import Combatant, Player, Asteroid, WorldBorder, PhysicalEntity, Projectile
 from model.systems.engines import TestShipEngine
 from model.systems.reactors import TestShipReactor
 from model.systems.shields import TestShipPhysicalDeflectionShields
@@ -26,6 +26,11 @@ class World:
         self.player: Player = player
         self.entities: SpriteList = entities or SpriteList()
         self.entities.append(player)
+        # combatants are tracked in a second bucket, so the per-tick loop does not need isinstance checks
+        self.combatants: SpriteList = SpriteList()
+        for entity in self.entities:
+            if isinstance(entity, Combatant):
+                self.combatants.append(entity)
         self.physics_engine = PhysicsEngine(damping=1, gravity=(0, 0))
         for entity in self.entities:
             self.physics_engine.add_sprite(entity, **entity.get_physics())
@@ -43,6 +48,8 @@ class World:
         """Create and add the entity to the world."""
         entity = entity_class(physics_engine=self.physics_engine, **entity_parameters)
         self.entities.append(entity)
+        if isinstance(entity, Combatant):
+            self.combatants.append(entity)
         self.physics_engine.add_sprite(entity, **entity.get_physics())
         with self.physics_engine.set_current_entity(entity):
             if "translational_speed" in entity_parameters: